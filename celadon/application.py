@@ -951,10 +951,10 @@ class Application(Page):  # pylint: disable=too-many-instance-attributes
                         widget.compute_dimensions(width, height)
 
                         for child in widget.drawables():
-                            origin = child.clipped_position
+                            x, y = child.clipped_position
 
-                            for i, line in enumerate(child.build()):
-                                write(line, cursor=(origin[0], origin[1] + i))
+                            for row, line in enumerate(child.build(), start=y):
+                                write(line, cursor=(x, row))
 
                     self._should_draw = False
                     did_draw = True
@@ -1108,6 +1108,18 @@ class Application(Page):  # pylint: disable=too-many-instance-attributes
         if self._mouse_target is None and len(page) > 0:
             self._mouse_target = page[0]
 
+    def remove_page(self, page: Page) -> None:
+        """Removes a page, leaving no page routed to if it was the current one."""
+
+        self._pages.remove(page)
+        page.parent = None
+
+        if self._page is page:
+            self._page = None
+
+        if self._mouse_target is not None and self._mouse_target in page:
+            self._mouse_target = None
+
     def remove(self, widget: Widget) -> None:
         super().remove(widget)
 
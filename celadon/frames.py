@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Tuple, Type
 
 __all__ = [
@@ -13,6 +14,15 @@ __all__ = [
 CharTuple = Tuple[str, str, str, str]
 
 
+def _repeat_to_width(pattern: str, width: int) -> str:
+    """Repeats the given pattern until it is exactly `width` characters long."""
+
+    if pattern == "":
+        return ""
+
+    return (pattern * (width // len(pattern) + 1))[:width]
+
+
 class Frame:  # pylint: disable=too-many-instance-attributes
     """A set of characters to wrap a widget by."""
 
@@ -31,6 +41,9 @@ class Frame:  # pylint: disable=too-many-instance-attributes
     height: int
     """Height of the top and bottom borders combined."""
 
+    insets: tuple[int, int, int, int]
+    """Whether the left, top, right and bottom borders are drawn, as 1 or 0."""
+
     outer_horizontal: bool = False
     """Use the parent's fill color (instead of our own) when drawing the sides."""
 
@@ -60,6 +73,14 @@ class Frame:  # pylint: disable=too-many-instance-attributes
 
         self.width = len(self.left + self.right)
         self.height = (self.borders[1] != "") + (self.borders[3] != "")
+        self.insets = (
+            int(self.left != ""),
+            int(self.top != ""),
+            int(self.right != ""),
+            int(self.bottom != ""),
+        )
+
+        self._horizontal_runs: dict[int, tuple[str, str]] = {}
 
     def _parse_descriptor(self) -> tuple[CharTuple, CharTuple]:
         """Parses the descriptor into tuples of chartuples."""
@@ -76,6 +97,22 @@ class Frame:  # pylint: disable=too-many-instance-attributes
             (left_top, right_top, right_bottom, left_bottom),
         )
 
+    def get_horizontal_runs(self, width: int) -> tuple[str, str]:
+        """Returns the top and bottom borders repeated to exactly `width` characters.
+
+        Multi-character borders are repeated as a pattern and cut off at `width`.
+        """
+
+        runs = self._horizontal_runs.get(width)
+
+        if runs is None:
+            runs = self._horizontal_runs[width] = (
+                _repeat_to_width(self.top, width),
+                _repeat_to_width(self.bottom, width),
+            )
+
+        return runs
+
     @property
     def name(self) -> str:
         """Return the frame class' name."""
@@ -110,6 +147,7 @@ class Frame:  # pylint: disable=too-many-instance-attributes
         return frame
 
 
+@lru_cache(maxsize=None)
 def get_frame(name: str) -> Type[Frame]:
     """Gets a frame by its name.
 
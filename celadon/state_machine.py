@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any
 
 from slate import Event
@@ -57,14 +57,20 @@ class StateMachine:
 
         self.states = states
         self._transitions = transitions
+        self._table = {
+            (source, action): target
+            for source, actions in transitions.items()
+            for action, target in actions.items()
+        }
 
         self._state = states[0]
         self._substate = "/"
+        self._update_full_state()
 
     def __call__(self) -> str:
         """Returns the current state, including substate."""
 
-        return self._state + (self._substate if self._substate != "/" else "")
+        return self._full_state
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} state: {self()!r}>"
@@ -111,6 +117,32 @@ class StateMachine:
 
         return StateMachine(new_states, transitions=new_transitions)
 
+    def clone(self) -> StateMachine:
+        """Creates an independent machine in the same state as this one.
+
+        Unlike `copy`, the states and transitions are shared instead of copied, as
+        they are never modified after creation. Only the current state is per-machine.
+
+        The clone gets its own `on_change` event, so subscribers of this machine are
+        not carried over to it.
+        """
+
+        machine = copy(self)
+        machine.on_change = Event("State Changed")
+
+        return machine
+
+    def _update_full_state(self) -> None:
+        """Composes the state returned by calling the machine.
+
+        This only happens when the state changes, so reading the state is free of
+        string building.
+        """
+
+        self._full_state = self._state + (
+            self._substate if self._substate != "/" else ""
+        )
+
     def apply_action(self, action: str) -> bool:
         """Applies some action to the state manager.
 
@@ -124,25 +156,23 @@ class StateMachine:
         """
 
         if action.startswith("SUBSTATE_"):
-            transitions = self._transitions[self._substate]
-
-            substate = transitions.get(action)
+            substate = self._table.get((self._substate, action))
 
             if substate is None:
                 return False
 
             self._substate = substate
+            self._update_full_state()
             return True
 
-        transitions = self._transitions.get(self._state, {})
-
-        state = transitions.get(action)
+        state = self._table.get((self._state, action))
 
         # No defined transition from the current state by the action
         if state is None:
             return False
 
         self._state = state
+        self._update_full_state()
 
         self.on_change(state)
         return True
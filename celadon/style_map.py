@@ -1,8 +1,28 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from copy import copy
+from typing import Any
 
-from .state_machine import deep_merge
+
+def _merge_copy(base: dict[Any, Any], other: dict[Any, Any]) -> dict[Any, Any]:
+    """Deep merges other onto a copy of base, only copying the dicts it changes.
+
+    Sub-dictionaries that `other` doesn't touch are shared with `base`, so merging
+    a single state onto a style map doesn't duplicate every other state's styles.
+    """
+
+    merged = copy(base)
+
+    for key, value in other.items():
+        current = merged.get(key)
+
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = _merge_copy(current, value)
+            continue
+
+        merged[key] = value
+
+    return merged
 
 
 class StyleMap(dict):
@@ -18,4 +38,4 @@ class StyleMap(dict):
         # if "*" in other:
         #     for key in
 
-        return StyleMap(deep_merge(deepcopy(self), other))
+        return StyleMap(_merge_copy(self, other))
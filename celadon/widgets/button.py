@@ -104,7 +104,7 @@ class Button(Widget):
         return self.on_submit(self)
 
     def _compute_shrink_width(self) -> int:
-        return sum(len(span) for span in self._parse_markup(self.content)) + 4
+        return sum(map(len, self._parse_markup(self.content))) + 4
 
     def _compute_shrink_height(self) -> int:
         return 1
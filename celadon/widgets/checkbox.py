@@ -64,6 +64,7 @@ class Checkbox(Widget):
         super().__init__(**widget_args)
 
         self._has_timeout = False
+        self._content_cache: tuple[tuple[Any, ...], list[str]] = ((), [])
 
         self.content = content
         self.checked = checked
@@ -117,6 +118,11 @@ class Checkbox(Widget):
         return {self.name: self.checked}
 
     def get_content(self) -> list[str]:
-        indicator = self.styles["indicator"](self.indicators[self.checked]) + "[/]"
+        indicator_style = self.styles["indicator"]
+        key = (indicator_style, self.indicators[self.checked], self.content)
 
-        return [f" {indicator} {self.content} "]
+        if key != self._content_cache[0]:
+            indicator = indicator_style(key[1]) + "[/]"
+            self._content_cache = (key, [f" {indicator} {self.content} "])
+
+        return self._content_cache[1]
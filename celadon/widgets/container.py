@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Any, Iterable, Iterator
 
 from slate import Key, Span
 
 from ..enums import Alignment, Direction, MouseAction, Anchor
-from .widget import Widget, _compute, handle_mouse_on_children
+from .widget import Widget, _compute, _to_enum, handle_mouse_on_children
 
 __all__ = [
     "Container",
@@ -13,6 +14,17 @@ __all__ = [
     "Row",
 ]
 
+_get_layer = attrgetter("layer")
+
+_SELECTION_STEPS = {
+    "left": -1,
+    "up": -1,
+    "shift-tab": -1,
+    "right": 1,
+    "down": 1,
+    "tab": 1,
+}
+
 
 def _align(alignment: Alignment, available: int) -> tuple[int, int]:
     """Returns offset & modulo result for alignment in the available space."""
@@ -31,6 +43,8 @@ def _align(alignment: Alignment, available: int) -> tuple[int, int]:
     return 0, 0
 
 
+# Layout & mouse lookups keep their last results around, to skip repeating work
+# pylint: disable-next=too-many-instance-attributes
 class Container(Widget):  # pylint: disable=too-many-public-methods
     """A widget that displays others based on some arrangement algorithm.
 
@@ -57,7 +71,9 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
 
         super().__init__(**widget_args)
 
-        self._should_layout = True
+        # Reset to None whenever the next `get_content` has to arrange regardless
+        self._layout_key: tuple[Any, ...] | None = None
+        self._flow_children: tuple[Widget, ...] | None = None
         self._mouse_target: Widget | None = None
         self._hover_target: Widget | None = None
         self._outer_dimensions = (1, 1)
@@ -78,10 +94,10 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
     def direction(self, new: Direction | str) -> None:
         """Sets the direction setting."""
 
-        if isinstance(new, str):
-            new = Direction(new)
+        self._direction = _to_enum(Direction, new)
 
-        self._direction = new
+        # Children are only in flow order along the direction they were arranged in
+        self._flow_children = None
 
     @property
     def selectable_count(self) -> int:
@@ -183,6 +199,34 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
             child.computed_height + gap for child in self.visible_children
         ) - gap
 
+    def _get_outer_dimensions(self, children: list[Widget]) -> tuple[int, int]:
+        """Returns the shrink width & height of the given children in a single pass.
+
+        This is equivalent to calling both `_compute_shrink_width` and
+        `_compute_shrink_height`, without walking the children twice.
+        """
+
+        gap = self.gap if isinstance(self.gap, int) else 0
+        is_horizontal = self.direction is Direction.HORIZONTAL
+
+        flow = 0
+        cross = 0
+
+        for child in children:
+            if is_horizontal:
+                flow += child.computed_width + gap
+                cross = max(cross, child.computed_height)
+            else:
+                flow += child.computed_height + gap
+                cross = max(cross, child.computed_width)
+
+        flow -= gap
+
+        if is_horizontal:
+            return self.frame.width + flow, self.frame.height + cross
+
+        return self.frame.width + cross, self.frame.height + flow
+
     @property
     def selected(self) -> Widget | None:
         return self._selected
@@ -236,7 +280,8 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
 
         self.children.insert(index, widget)
         widget.parent = self
-        self._should_layout = True
+        self._layout_key = None
+        self._flow_children = None
 
     def append(self, widget: Widget) -> None:
         """Adds a new widget setting its parent attribute to self.
@@ -264,7 +309,8 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
         self.children.remove(widget)
 
         widget.parent = None
-        self._should_layout = True
+        self._layout_key = None
+        self._flow_children = None
 
         if self._mouse_target is widget:
             self._mouse_target = None
@@ -309,6 +355,8 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
 
         self.children[index + offset] = new
         new.parent = self
+        self._layout_key = None
+        self._flow_children = None
 
     def move_by(self, x: int, y: int) -> None:
         """Moves the widget (and all its children) to the given position."""
@@ -330,9 +378,7 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
 
         children = self.visible_children
 
-        layouted_children = [
-            child for child in self.visible_children if child.anchor == Anchor.NONE
-        ]
+        layouted_children = [child for child in children if child.anchor == Anchor.NONE]
         layouted_count = len(layouted_children)
 
         width = self._framed_width - self.has_scrollbar(1)
@@ -375,10 +421,18 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
 
         origin = x, y
 
+        align_horizontal, align_vertical = self.alignment
+
+        # The offset along the flow only depends on the gap, so it's shared by all
+        flow_start, flow_extra = _align(
+            align_horizontal if is_horizontal else align_vertical, gap
+        )
+        flow_offset = flow_start + flow_extra
+
         t_width, t_height = self.terminal.size
         t_ox, t_oy = self.terminal.origin
 
-        s_start, s_end = [list(val) for val in self.inner_rect]
+        (s_left, s_top), (s_right, s_bottom) = self.inner_rect
 
         for child in children:
             if self._is_fill(child, is_horizontal):
@@ -387,7 +441,7 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
                 if is_horizontal:
                     child.compute_dimensions(fill_size + fill_extra, height)
                 else:
-                    child.compute_dimensions(width, fill_size)
+                    child.compute_dimensions(width, fill_size + fill_extra)
 
                 fill_remainder -= 1
 
@@ -430,74 +484,114 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
                 child.move_to(t_ox + offset[0], t_oy + offset[1])
 
             else:  # child.anchor == Anchor.NONE
-                # TODO: Some of these could be computed out of loop.
                 if is_horizontal:
-                    align_x, align_x_extra = _align(
-                        self.alignment[0],
-                        gap,
-                    )
-                    align_y, align_y_extra = _align(
-                        self.alignment[1],
-                        height - child.computed_height,
+                    cross_offset = sum(
+                        _align(align_vertical, height - child.computed_height)
                     )
 
-                    child.move_to(
-                        x + align_x + align_x_extra, y + align_y + align_y_extra
-                    )
+                    child.move_to(x + flow_offset, y + cross_offset)
                     x += child.computed_width + gap + (1 * gap_extra > 0)
 
                 else:
-                    align_x, align_x_extra = _align(
-                        self.alignment[0],
-                        width - child.computed_width,
-                    )
-                    align_y, align_y_extra = _align(
-                        self.alignment[1],
-                        gap,
+                    cross_offset = sum(
+                        _align(align_horizontal, width - child.computed_width)
                     )
 
-                    child.move_to(
-                        x + align_x + align_x_extra, y + align_y + align_y_extra
-                    )
+                    child.move_to(x + cross_offset, y + flow_offset)
                     y += child.computed_height + gap + (1 * gap_extra > 0)
 
                 gap_extra -= 1
 
-                clip_start, clip_end = [0, 0], [0, 0]
+                # Clip whatever overhangs our inner rect on each side
+                c_x, c_y = child.position
 
-                c_start, c_end = child.outer_rect
+                child.clip(
+                    (max(s_left - c_x, 0), max(s_top - c_y, 0)),
+                    (
+                        max(c_x + child.computed_width - s_right, 0),
+                        max(c_y + child.computed_height - s_bottom, 0),
+                    ),
+                )
 
-                if c_start[0] < s_start[0]:
-                    clip_start[0] = s_start[0] - c_start[0]
+        self._outer_dimensions = self._get_outer_dimensions(children)
 
-                if c_start[1] < s_start[1]:
-                    clip_start[1] = s_start[1] - c_start[1]
+        # Children are placed in non-overlapping flow order only if none of them are
+        # anchored and the gap doesn't pull them back, which mouse lookups rely on.
+        if len(layouted_children) == len(children) and gap >= 0:
+            self._flow_children = tuple(children)
+        else:
+            self._flow_children = None
 
-                if s_end[0] < c_end[0]:
-                    clip_end[0] = c_end[0] - s_end[0]
+    def _get_layout_key(self, x: int, y: int) -> tuple[Any, ...]:
+        """Returns all the inputs `arrange` positions and clips our children by.
 
-                if s_end[1] < c_end[1]:
-                    clip_end[1] = c_end[1] - s_end[1]
+        Children are only sized by their specifications, apart from shrinking ones
+        whose content size is included as well.
+        """
 
-                child.clip(clip_start, clip_end)
+        children = tuple(
+            (
+                child,
+                child.width,
+                child.height,
+                child.width_offset,
+                child.height_offset,
+                child.anchor,
+                child.offset,
+                child.frame,
+                child.get_shrink_size(),
+            )
+            for child in self.visible_children
+        )
 
-        self._outer_dimensions = [
-            self._compute_shrink_width(),
-            self._compute_shrink_height(),
-        ]
+        terminal = self.terminal
+        screen = None if terminal is None else (terminal.size, terminal.origin)
+
+        return (
+            x,
+            y,
+            self.computed_width,
+            self.computed_height,
+            self.inner_rect,
+            self.has_scrollbar(0),
+            self.has_scrollbar(1),
+            self.direction,
+            self.alignment,
+            self.gap,
+            screen,
+            children,
+        )
 
     def get_content(self) -> list[str]:
-        """Calls our `arrange` method and returns a single empty line."""
+        """Calls our `arrange` method and returns a single empty line.
 
-        # layout_state = self._as_layout_state()
+        Arranging is skipped when none of its inputs changed since the last call, or
+        when we are clipped out entirely, in which case our children are as well.
+        """
+
+        children = self.visible_children
+
+        if self.is_clipped_out() and all(
+            child.anchor is Anchor.NONE for child in children
+        ):
+            for child in children:
+                child.clip((0, 0), (child.computed_width, child.computed_height))
+
+            # The children's clips no longer match the last layout
+            self._layout_key = None
+
+            return [""]
+
+        frame_left, frame_top, *_ = self.frame.insets
 
-        # if layout_state != self._layout_state:
-        start_x = self.position[0] + (self.frame.left != "")
-        start_y = self.position[1] + (self.frame.top != "")
+        start_x = self.position[0] + frame_left - self.scroll[0]
+        start_y = self.position[1] + frame_top - self.scroll[1]
 
-        if self._should_layout:
-            self.arrange(start_x - self.scroll[0], start_y - self.scroll[1])
-        # self._layout_state = layout_state
+        layout_key = self._get_layout_key(start_x, start_y)
+
+        if layout_key != self._layout_key:
+            self.arrange(start_x, start_y)
+            self._layout_key = layout_key
 
         return [""]
 
@@ -505,23 +599,63 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
         if self.selected is not None and self.selected.handle_keyboard(key):
             return True
 
-        idx = self._selected_index or 0
-
-        if key in ("left", "up", "shift-tab"):
-            self.select(idx - 1)
+        for value in key:
+            step = _SELECTION_STEPS.get(value)
 
-        if key in ("right", "down", "tab"):
-            self.select(idx + 1)
+            if step is not None:
+                self.select((self._selected_index or 0) + step)
+                break
 
         return super().handle_keyboard(key)
 
+    def _get_children_at(self, position: tuple[int, int]) -> list[Widget]:
+        """Narrows our visible children down to the ones that may contain `position`.
+
+        If no child was added, removed or replaced since the last `arrange` placed them
+        in flow order, their starts along the flow axis are ascending, so candidates
+        are found by bisecting instead of testing every child. Otherwise, all visible
+        children are returned.
+        """
+
+        children = self._flow_children
+
+        if children is None:
+            return self.visible_children
+
+        axis = 0 if self.direction is Direction.HORIZONTAL else 1
+        point = position[axis]
+
+        low, high = 0, len(children)
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if children[middle].position[axis] <= point:
+                low = middle + 1
+            else:
+                high = middle
+
+        start = low
+
+        while start > 0:
+            child = children[start - 1]
+            size = child.computed_width if axis == 0 else child.computed_height
+
+            if child.position[axis] + size < point:
+                break
+
+            start -= 1
+
+        # Children hidden since the last arrange are still in its flow order
+        return [child for child in children[start:low] if "hidden" not in child.groups]
+
     def handle_mouse(self, action: MouseAction, position: tuple[int, int]) -> bool:
         result, mouse_target, hover_target = handle_mouse_on_children(
             action,
             position,
             self._mouse_target,
             self._hover_target,
-            self.visible_children,
+            self._get_children_at(position),
         )
 
         self._mouse_target = mouse_target
@@ -551,7 +685,7 @@ class Container(Widget):  # pylint: disable=too-many-public-methods
     def drawables(self) -> Iterator[Widget]:
         yield from super().drawables()
 
-        for widget in sorted(self.children, key=lambda w: w.layer):
+        for widget in sorted(self.children, key=_get_layer):
             yield from widget.drawables()
 
     def build(
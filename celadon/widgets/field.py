@@ -142,7 +142,7 @@ class Field(Widget):
 
         # Scroll to cursor
         scroll_offsets = [0, 0]
-        frame_start = (self.frame.borders[0] != "", self.frame.borders[1] != "")
+        frame_start = self.frame.insets[:2]
         dimensions = (self.computed_width - 1, self.computed_height)
 
         absolute_cursor = (
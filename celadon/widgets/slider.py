@@ -8,6 +8,8 @@ from ..enums import MouseAction
 from .widget import Widget, to_widget_space, wrap_callback
 
 
+# The bar's styled cells are cached, as scrollbars are rebuilt with every frame
+# pylint: disable-next=too-many-instance-attributes
 class Slider(Widget):
     """A clickable and draggable slider."""
 
@@ -93,6 +95,7 @@ class Slider(Widget):
         self.bind("left", wrap_callback(self.decrease))
 
         self._grab_offset = 0
+        self._content_cache: tuple[tuple[Any, ...], list[str]] = ((), [])
 
     @property
     def value(self) -> float:
@@ -152,19 +155,58 @@ class Slider(Widget):
 
         return True
 
-    def _build(self, dimension: int) -> list[str]:
-        start = min(round(dimension * self._value), dimension - self.cursor_size)
+    def _get_cursor_start(self, dimension: int) -> int:
+        """Returns the offset of the cursor within the given dimension."""
 
-        style = self.styles["content"]
+        return min(round(dimension * self._value), dimension - self.cursor_size)
 
-        return [
-            *[style(self.rail) for _ in range(start)],
-            *[self.styles["cursor"](self.cursor) for _ in range(self.cursor_size)],
-            *[style(self.rail) for _ in range(dimension - start - self.cursor_size)],
-        ]
+    def _get_content_key(self, dimension: int) -> tuple[Any, ...]:
+        """Returns everything our content depends on when drawn along `dimension`.
+
+        The bar only changes when one of these does, so `get_content` can reuse the
+        previous lines otherwise.
+        """
+
+        return (
+            dimension,
+            self._get_cursor_start(dimension),
+            self.cursor_size,
+            self.rail,
+            self.cursor,
+            self.styles["content"],
+            self.styles["cursor"],
+        )
+
+    def _build(self, dimension: int, start: int) -> list[str]:
+        """Returns one styled cell per unit of `dimension`, with the cursor at `start`."""
+
+        start = max(start, 0)
+
+        cells = [self.styles["content"](self.rail)] * dimension
+        cells[start : start + self.cursor_size] = [
+            self.styles["cursor"](self.cursor)
+        ] * self.cursor_size
+
+        return cells
 
     def get_content(self) -> list[str]:
-        return ["".join(self._build(self.computed_width))]
+        dimension = self.computed_width
+        key = self._get_content_key(dimension)
+
+        if key != self._content_cache[0]:
+            start = key[1]
+            style = self.styles["content"]
+
+            self._content_cache = (
+                key,
+                [
+                    style(self.rail * start)
+                    + self.styles["cursor"](self.cursor * self.cursor_size)
+                    + style(self.rail * (dimension - start - self.cursor_size))
+                ],
+            )
+
+        return self._content_cache[1]
 
 
 class VerticalSlider(Slider):
@@ -198,4 +240,10 @@ class VerticalSlider(Slider):
         return True
 
     def get_content(self) -> list[str]:
-        return self._build(self.computed_height)
+        dimension = self.computed_height
+        key = self._get_content_key(dimension)
+
+        if key != self._content_cache[0]:
+            self._content_cache = (key, self._build(dimension, key[1]))
+
+        return self._content_cache[1]
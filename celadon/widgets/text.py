@@ -28,8 +28,18 @@ class Text(Widget):
         self.content = content
 
         self._wrapped_content = []
+        self._wrap_key: tuple[Any, ...] = ()
+        self._shrink_width: tuple[str | None, int] = (None, 0)
 
         def _wrap_content(_ = None) -> bool:
+            # Content rarely changes between builds, so only split it when it does
+            key = (self.content, self.wrap, self.wrap and self._framed_width)
+
+            if key == self._wrap_key:
+                return True
+
+            self._wrap_key = key
+
             if self.wrap:
                 self._wrapped_content = zml_wrap(self.content, width=self._framed_width)
             else:
@@ -41,14 +51,23 @@ class Text(Widget):
         _wrap_content()
 
     def _compute_shrink_width(self) -> int:
-        return max(
+        # Shrinking widgets are measured on every layout, so only re-split new content
+        content, width = self._shrink_width
+
+        if content == self.content:
+            return width
+
+        width = max(
             (
-                sum(len(span) for span in self._parse_markup(line))
+                sum(map(len, self._parse_markup(line)))
                 for line in self.content.splitlines()
             ),
             default=0,
         )
 
+        self._shrink_width = (self.content, width)
+        return width
+
     def _compute_shrink_height(self) -> int:
         return len(self._wrapped_content)
 
@@ -2,14 +2,24 @@
 from __future__ import annotations
 
 import re
-import uuid
-from copy import deepcopy
-from dataclasses import dataclass
-from functools import lru_cache, wraps
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Literal, Type
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, fields
+from enum import Enum
+from functools import lru_cache, partial, wraps
+from itertools import accumulate, chain, count, repeat
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Literal,
+    Type,
+    TypeVar,
+)
 
 from slate import Event, Key, Span, Terminal
-from slate.span import EMPTY_SPAN
 from zenith.markup import FULL_RESET, zml_get_spans, zml_pre_process, preserve_escapes
 
 from ..enums import Alignment, MouseAction, Overflow, Anchor
@@ -23,8 +33,21 @@ if TYPE_CHECKING:
 
 __all__ = ["Widget", "widget_types", "handle_mouse_on_children"]
 
+EnumT = TypeVar("EnumT", bound=Enum)
+
+_WIDGET_IDS = count()
+
 RE_FULL_UNSETTER = re.compile(r"(?<=\[)[^\]]*(\/)")
 
+_EMPTY_LINES = ((), (Span(""),))
+
+# Enum members are looked up on every aligned line, so bind them once
+_ALIGN_START = Alignment.START
+_ALIGN_CENTER = Alignment.CENTER
+_ALIGN_END = Alignment.END
+_OVERFLOW_SCROLL = Overflow.SCROLL
+_OVERFLOW_HIDE = Overflow.HIDE
+
 
 def _get_mouse_action_name_options(action: MouseAction) -> tuple[str, ...]:
     if action.value == "hover":
@@ -46,8 +69,41 @@ _MOUSE_ACTION_NAME_OPTIONS = {
     action: _get_mouse_action_name_options(action) for action in MouseAction
 }
 
+_MOUSE_HANDLER_NAMES = {
+    action: tuple(f"on_{name}" for name in options)
+    for action, options in _MOUSE_ACTION_NAME_OPTIONS.items()
+}
+
+
+def _get_mouse_state_action(action: MouseAction) -> str | None:
+    """Returns the state machine action a mouse action results in, if any."""
+
+    value = action.value
+
+    if "click" in value:
+        return "CLICKED"
+
+    if "release" in value:
+        return "RELEASED"
+
+    if "hover" in value:
+        return "HOVERED"
+
+    return None
+
+
+_MOUSE_STATE_ACTIONS = {
+    action: _get_mouse_state_action(action) for action in MouseAction
+}
+
+_SCROLL_ACTIONS = frozenset(
+    action for action in MouseAction if "scroll" in action.value
+)
+_SCROLL_X_FORWARD = (MouseAction.SCROLL_LEFT, MouseAction.SHIFT_SCROLL_UP)
+_SCROLL_X_BACKWARD = (MouseAction.SCROLL_RIGHT, MouseAction.SHIFT_SCROLL_DOWN)
 
-@dataclass
+
+@dataclass(frozen=True)
 class BoundStyle:
     """A callable object containing both style and fill markup."""
 
@@ -58,6 +114,22 @@ class BoundStyle:
         return f"[{self.fill}{self.style}]{item}"
 
 
+@lru_cache(maxsize=None)
+def _to_enum(enum: Type[EnumT], value: Any) -> EnumT:
+    """Converts a value (or member) into an enum member, caching the lookup."""
+
+    return enum(value)
+
+
+@lru_cache(maxsize=None)
+def _to_enum_pair(
+    enum: Type[EnumT], horizontal: Any, vertical: Any
+) -> tuple[EnumT, EnumT]:
+    """Converts a pair of values (or members) into a shared tuple of enum members."""
+
+    return (_to_enum(enum, horizontal), _to_enum(enum, vertical))
+
+
 def _compute(spec: int | float | None, hint: int) -> int:
     if isinstance(spec, float):
         return int(spec * hint)
@@ -70,12 +142,227 @@ def _compute(spec: int | float | None, hint: int) -> int:
     return spec
 
 
+@lru_cache(maxsize=None)
+def _get_frame_instance(frame: Type[Frame]) -> Frame:
+    """Returns a shared instance of the given frame type.
+
+    Frames aren't modified after creation, so there is no need to create a new one
+    every time a widget's frame is (re)assigned.
+    """
+
+    return frame()
+
+
+@lru_cache(maxsize=None)
+def _get_composed_frame(sides: tuple[str | None, ...]) -> Frame:
+    """Returns a shared frame composed from the given side names."""
+
+    return Frame.compose(tuple(get_frame(side) for side in sides))  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def _fill_palette(style: str, palette: str) -> str:
+    """Namespaces the palette references (`.name`, `@.name`) of a style.
+
+    Widgets configured by the same rules share their styles, so the result is cached
+    across all of them.
+    """
+
+    words = []
+
+    for word in style.split(" "):
+        if not (word.startswith(".") or word.startswith("@.")):
+            words.append(word)
+            continue
+
+        alpha = ""
+
+        if "*" in word:
+            word, alpha = word.split("*")
+            alpha = "*" + alpha
+
+        words.append(word.replace(".", palette + ".", 1) + alpha)
+
+    return " ".join(words)
+
+
+@lru_cache(maxsize=None)
+def _bind_style(style: str, fill: str) -> BoundStyle:
+    """Returns a shared bound style for the given style & fill markup.
+
+    Widgets in the same state mostly resolve to the same styles, so sharing them
+    lets comparisons against them (e.g. in build keys) succeed by identity.
+    """
+
+    return BoundStyle(style, fill)
+
+
+@lru_cache(maxsize=None)
+def _get_unsetter_sub(content_style: str) -> Callable[[str], str]:
+    """Returns a function replacing full unsetters with `/ {content_style}`."""
+
+    return partial(RE_FULL_UNSETTER.sub, "/ " + content_style)
+
+
+@lru_cache(maxsize=4096)
+def _parse_markup_cached(content_style: str, markup: str) -> tuple[Span, ...]:
+    """Parses markup into spans, using `content_style` after full unsetters.
+
+    The same markup (fillers, frame borders, scrollbar cells) is parsed for every line
+    of every build, so the results are shared. Spans are immutable, so this is safe.
+    """
+
+    # Replace full unsetters with full unsetter + content style
+    markup = _get_unsetter_sub(content_style)(markup)
+
+    markup = zml_pre_process(preserve_escapes(markup))
+
+    return tuple(span for span in zml_get_spans(markup) if span is not FULL_RESET)
+
+
+@lru_cache(maxsize=256)
+def _compose_frame_rows(  # pylint: disable=too-many-locals
+    frame: Frame,
+    width: int,
+    inner_style: BoundStyle,
+    outer_style: BoundStyle,
+    unsetter_style: str,
+) -> tuple[
+    tuple[Span, ...] | None,
+    tuple[Span, ...],
+    tuple[Span, ...],
+    tuple[Span, ...] | None,
+]:
+    """Returns the styled top row, sides and bottom row of a frame at `width`.
+
+    Frames are shared and styles are immutable, so the rows are shared between every
+    widget (and frame it switches back to) drawing the same frame at the same width.
+    """
+
+    def _style(item: str, outer: bool = False) -> tuple[Span, ...]:
+        return _parse_markup_cached(
+            unsetter_style, (outer_style if outer else inner_style)(item)
+        )
+
+    left_top, right_top, right_bottom, left_bottom = frame.corners
+    left, top, right, bottom = frame.borders
+
+    h_outer = frame.outer_horizontal
+    v_outer = frame.outer_vertical
+    c_outer = frame.outer_corner
+
+    top_run, bottom_run = frame.get_horizontal_runs(width)
+
+    top_row = bottom_row = None
+
+    if left_top + top + right_top != "":
+        top_row = (
+            _style(left_top or (left != "") * top, outer=c_outer)
+            + _style(top_run, outer=h_outer)
+            + _style(right_top or (right != "") * top, outer=c_outer)
+        )
+
+    if left_bottom + bottom + right_bottom != "":
+        bottom_row = (
+            _style(left_bottom or (left != "") * bottom, outer=c_outer)
+            + _style(bottom_run, outer=h_outer)
+            + _style(right_bottom or (right != "") * bottom, outer=c_outer)
+        )
+
+    return (
+        top_row,
+        _style(left, outer=v_outer),
+        _style(right, outer=v_outer),
+        bottom_row,
+    )
+
+
 def _overflows(real: int, virt: int) -> bool:
     """Determines whether the given real and virtual dimensions overflow."""
 
     return real / max(virt, 1) <= 1.0
 
 
+def _trim_spans(line: tuple[Span, ...], start: int, width: int) -> list[Span]:
+    """Trims a line of spans to `width` characters, starting at `start`.
+
+    The spans crossing either edge are found by bisecting the line's offsets, and
+    only those are sliced. Spans that end up empty are dropped.
+    """
+
+    end = start + width
+
+    # Where each span starts, and the line's end. Hashing the spans to cache this
+    # would cost more than summing their lengths.
+    offsets = (0, *accumulate(map(len, line)))
+
+    first = max(bisect_right(offsets, start) - 1, 0)
+    last = min(bisect_left(offsets, end), len(line))
+
+    line_list = []
+
+    for i in range(first, last):
+        span = line[i]
+        span_start, span_end = offsets[i], offsets[i + 1]
+
+        if span_start < start or span_end > end:
+            span = span[max(start - span_start, 0) : end - span_start]
+
+        if span.text:
+            line_list.append(span)
+
+    return line_list
+
+
+_get_span_style = attrgetter(
+    *(fld.name for fld in fields(Span) if fld.init and fld.name != "text")
+)
+
+
+@lru_cache(1024)
+def _coalesce_spans(line: tuple[Span, ...]) -> tuple[Span, ...]:
+    """Merges adjacent spans that share the same styling into one.
+
+    Fewer spans means less work for framing, clipping and the terminal writes that
+    follow, while the displayed result stays identical.
+    """
+
+    if len(line) < 2:
+        return line
+
+    starts: list[int] = []
+    previous_key = None
+
+    for i, span in enumerate(line):
+        key = _get_span_style(span)
+
+        if key != previous_key:
+            starts.append(i)
+            previous_key = key
+
+    if len(starts) == len(line):
+        return line
+
+    merged: list[Span] = []
+
+    # Join each run's text once, instead of growing the first span's text per span
+    for start, end in zip(starts, starts[1:] + [len(line)]):
+        first = line[start]
+
+        if end - start == 1:
+            merged.append(first)
+            continue
+
+        merged.append(
+            first.mutate(
+                text="".join(span.text for span in line[start:end]),
+                reset_after=first.reset_after,
+            )
+        )
+
+    return tuple(merged)
+
+
 def to_widget_space(pos: tuple[int, int], widget: Widget) -> tuple[int, int]:
     """Computes a position as an offset from the widget's origin.
 
@@ -113,6 +400,54 @@ def wrap_callback(callback: Callable[[], Any]) -> Callable[[Widget], bool]:
 class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """This is a docstring."""
 
+    # The attributes touched on every build get fixed slots; `__dict__` is kept so
+    # rules (and subclasses) can still set arbitrary attributes.
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "eid",
+        "groups",
+        "position",
+        "parent",
+        "width",
+        "height",
+        "offset",
+        "palette",
+        "computed_width",
+        "computed_height",
+        "width_offset",
+        "height_offset",
+        "pre_content",
+        "on_content",
+        "pre_build",
+        "on_build",
+        "_frame",
+        "_alignment",
+        "_overflow",
+        "_anchor",
+        "_disabled",
+        "_scroll",
+        "_virtual_width",
+        "_virtual_height",
+        "_last_query",
+        "_selected_index",
+        "_selected",
+        "_clip_start",
+        "_clip_end",
+        "_bindings",
+        "_scrollbar_x",
+        "_scrollbar_y",
+        "_scrolling_x",
+        "_scrolling_y",
+        "_scrollbar_corner_fill",
+        "_mouse_target",
+        "_hover_target",
+        "_build_cache",
+        "_styles_cache",
+        "_styles_source",
+        "_scrollbar_layout",
+    )
+
     width: int | float | None
     """The hint used by the widget to calculate it's width. See dimension hints."""
 
@@ -249,17 +584,17 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         """Initializes a Widget.
 
         Args:
-            eid: The id for this widget. Defaults to a UUID.
+            eid: The id for this widget. Defaults to a process-unique `w-{n}` id.
             group: If set, `groups` is overwritten as `(group,)`.
             groups: The initial groups this widget will belong to.
         """
 
-        self.eid = eid or str(uuid.uuid4())
+        self.eid = eid or f"w-{next(_WIDGET_IDS)}"
         if group is not None:
             groups = (group,)
         self.groups = tuple(groups)
         self.position = (0, 0)
-        self.state_machine = deepcopy(self.state_machine)
+        self.state_machine = self.state_machine.clone()
         self.parent: "Container" | "Page" | None = None
         self.disabled = disabled
 
@@ -276,7 +611,7 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         self._virtual_width = 0
         self._virtual_height = 0
-        self._last_query: str | None = None
+        self._last_query: tuple[str | None, tuple[str, ...], str] | None = None
         self._selected_index: int | None = None
         self._selected: Widget | None = None
 
@@ -309,6 +644,15 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         self._mouse_target: Widget | None = None
         self._hover_target: Widget | None = None
 
+        self._build_cache: tuple[tuple[Any, ...] | None, list[tuple[Span, ...]]] = (
+            None,
+            [],
+        )
+
+        self._styles_cache: dict[str, dict[str, BoundStyle]] = {}
+        self._styles_source: tuple[StyleMap | None, str | None] = (None, None)
+        self._scrollbar_layout: tuple[Any, ...] | None = None
+
         self.setup()
 
         widget_types[type(self).__name__] = type(self)
@@ -330,13 +674,18 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         from .slider import Slider
 
         if self._scrollbar_x is None:
-            self._scrollbar_x = Slider(groups=("-scroll", "-scroll-x"))
+            scrollbar = Slider(groups=("-scroll", "-scroll-x"))
 
-            self._scrollbar_x.parent = self
-            self._scrollbar_x.on_change += (
+            scrollbar.parent = self  # type: ignore[assignment]
+            scrollbar.on_change += (
                 lambda val: self.scroll_to(x=int(val * self._virtual_width)) or True
             )
 
+            if self._virtual_width > 0:
+                scrollbar.value = self.scroll[0] / self._virtual_width
+
+            self._scrollbar_x = scrollbar
+
         return self._scrollbar_x
 
     @property
@@ -344,13 +693,18 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         from .slider import VerticalSlider
 
         if self._scrollbar_y is None:
-            self._scrollbar_y = VerticalSlider(groups=("-scroll", "-scroll-y"))
+            scrollbar = VerticalSlider(groups=("-scroll", "-scroll-y"))
 
-            self._scrollbar_y.parent = self
-            self._scrollbar_y.on_change += (
+            scrollbar.parent = self  # type: ignore[assignment]
+            scrollbar.on_change += (
                 lambda val: self.scroll_to(y=int(val * self._virtual_height)) or True
             )
 
+            if self._virtual_height > 0:
+                scrollbar.value = self.scroll[1] / self._virtual_height
+
+            self._scrollbar_y = scrollbar
+
         return self._scrollbar_y
 
     @property
@@ -370,10 +724,7 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     @scroll.setter
     def scroll(self, new: tuple[int, int]) -> None:
         self._scroll = new
-
-        if self._virtual_width > 0:
-            self.scrollbar_x.value = new[0] / self._virtual_width
-            self.scrollbar_y.value = new[1] / self._virtual_height
+        self._sync_scrollbars()
 
     @property
     def state(self) -> str:
@@ -388,50 +739,52 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         Note that the `fill` style is inserted into every other style, and is
         stored under the `_fill` key for special circumstances where you may
         need to reference it.
+
+        The result is cached per state, and is recomputed once `style_map` or
+        `palette` gets reassigned. Don't mutate the returned dictionary.
         """
 
+        style_map = self.style_map
         palette = self.palette
 
-        def _fill_palette(style: str) -> str:
-            words = []
+        source_map, source_palette = self._styles_source
 
-            for word in style.split(" "):
-                if not (word.startswith(".") or word.startswith("@.")):
-                    words.append(word)
-                    continue
+        if source_map is not style_map or source_palette != palette:
+            self._styles_cache = {}
+            self._styles_source = (style_map, palette)
 
-                alpha = ""
+        state = self.state
+        styles = self._styles_cache.get(state)
 
-                if "*" in word:
-                    word, alpha = word.split("*")
-                    alpha = "*" + alpha
+        if styles is None:
+            styles = self._styles_cache[state] = self._compute_styles(state)
 
-                words.append(word.replace(".", palette + ".", 1) + alpha)
+        return styles
 
-            return " ".join(words)
+    def _compute_styles(self, state: str) -> dict[str, BoundStyle]:
+        """Computes the bound styles for the given state. See `styles`."""
 
-        styles = self.style_map[self.state.split("/")[0]].copy()
+        palette = self.palette
 
-        if "/" in self.state:
-            key = "/" + self.state.split("/")[-1]
+        styles = self.style_map[state.split("/", 1)[0]]
 
-            if key in self.style_map:
-                styles |= self.style_map[key].items()
+        if "/" in state:
+            substyles = self.style_map.get("/" + state.rsplit("/", 1)[-1])
 
-        output = {}
+            if substyles is not None:
+                styles = {**styles, **substyles}
 
-        fill = _fill_palette(styles["fill"])
+        output = {}
 
-        if fill != "":
-            fill += " "
+        fill = _fill_palette(styles["fill"], palette)
+        fill_prefix = fill + " " if fill != "" else ""
 
         for key, style in styles.items():
             if key == "fill":
-                key = "_fill"
-
-            style = _fill_palette(style)
+                output["_fill"] = _bind_style(fill, fill_prefix)
+                continue
 
-            output[key] = BoundStyle(style, fill)
+            output[key] = _bind_style(_fill_palette(style, palette), fill_prefix)
 
         return output
 
@@ -462,17 +815,14 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     def frame(self, new: str | tuple[str, str, str, str] | Type[Frame]) -> None:
         """Sets the frame setting."""
 
-        current = getattr(self, "_frame", None)
-
         if isinstance(new, tuple):
-            sides = tuple(get_frame(side) for side in new)
-            self._frame = Frame.compose(sides)  # type: ignore
+            self._frame = _get_composed_frame(new)
             return
 
         if isinstance(new, str) or new is None:
             new = get_frame(new)
 
-        self._frame = new()
+        self._frame = _get_frame_instance(new)  # type: ignore[arg-type]
 
     @property
     def alignment(self) -> tuple[Alignment, Alignment]:
@@ -489,11 +839,9 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     def alignment(self, new: tuple[Alignment, Alignment] | tuple[str, str]) -> None:
         """Sets the alignment setting."""
 
-        if not all(isinstance(item, Alignment) for item in new):
-            new = Alignment(new[0]), Alignment(new[1])
+        horizontal, vertical = new
 
-        assert isinstance(new[0], Alignment) and isinstance(new[1], Alignment)
-        self._alignment = new
+        self._alignment = _to_enum_pair(Alignment, horizontal, vertical)
 
     @property
     def overflow(self) -> tuple[Overflow, Overflow]:
@@ -510,11 +858,9 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     def overflow(self, new: tuple[Overflow, Overflow] | tuple[str, str]) -> None:
         """Sets the overflow setting."""
 
-        if not all(isinstance(item, Overflow) for item in new):
-            new = Overflow(new[0]), Overflow(new[1])
+        horizontal, vertical = new
 
-        assert isinstance(new[0], Overflow) and isinstance(new[1], Overflow)
-        self._overflow = new
+        self._overflow = _to_enum_pair(Overflow, horizontal, vertical)
 
     @property
     def anchor(self) -> Anchor:
@@ -526,22 +872,19 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     def anchor(self, new: str | Anchor) -> None:
         """Sets the widget's anchor."""
 
-        if isinstance(new, str):
-            new = Anchor(new)
-
-        self._anchor = new
+        self._anchor = _to_enum(Anchor, new)
 
     @property
     def _framed_width(self) -> int:
         """Gets the widget's width excluding its frame."""
 
-        return max(self.computed_width - self.frame.width, 0)
+        return max(self.computed_width - self._frame.width, 0)
 
     @property
     def _framed_height(self) -> int:
         """Gets the widget's height excluding its frame."""
 
-        return max(self.computed_height - self.frame.height, 0)
+        return max(self.computed_height - self._frame.height, 0)
 
     @property
     def disabled(self) -> bool:
@@ -573,13 +916,13 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     def inner_rect(self) -> tuple[tuple[int, int], tuple[int, int]]:
         """Returns the inner rect of this widget."""
 
-        frame = self.frame
-        frame_bottom_raw = self.frame.bottom != ""
-        frame_right_raw = self.frame.right != ""
+        frame_left_raw, frame_top_raw, frame_right_raw, frame_bottom_raw = (
+            self.frame.insets
+        )
 
-        frame_left = (frame.left != "") * (self._clip_start[0] == 0)
+        frame_left = frame_left_raw * (self._clip_start[0] == 0)
         frame_right = frame_right_raw * (self._clip_end[0] == 0)
-        frame_top = (frame.top != "") * (self._clip_start[1] == 0)
+        frame_top = frame_top_raw * (self._clip_start[1] == 0)
         frame_bottom = frame_bottom_raw * (self._clip_end[1] == 0)
 
         # Only add space for bars if they are clipped
@@ -623,41 +966,70 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             self.position[1] + self.computed_height,
         )
 
-    @lru_cache(1024)
     def _parse_markup(self, markup: str) -> tuple[Span, ...]:
         """Parses some markup into a span of tuples.
 
         This also handles (ignores) zenith's FULL_RESET spans, and replaces `/`
         unsetters with `/ {fill_style} {content_style}`.
+
+        Results are cached by markup and unsetter style, not by widget, so they
+        follow state changes and don't keep widgets alive.
         """
 
+        return _parse_markup_cached(self._get_unsetter_style(), markup)
+
+    def _get_unsetter_style(self) -> str:
+        """Returns the style full unsetters are replaced with in `_parse_markup`."""
+
         fill = self.styles["_fill"]
 
         if isinstance(self.parent, Widget) and fill.style == "":
             fill = self.parent.styles["_fill"]
 
-        content_style = fill.style + " " + self.styles["content"].style
+        return fill.style + " " + self.styles["content"].style
 
-        # Replace full unsetters with full unsetter + content style
-        markup = RE_FULL_UNSETTER.sub("/ " + content_style, markup)
+    def _sync_scrollbars(self) -> None:
+        """Matches the scrollbars' values to our current scroll & virtual size."""
 
-        markup = zml_pre_process(preserve_escapes(markup))
+        # Scrollbars are created lazily once they are shown, so only sync existing ones
+        if self._scrollbar_x is not None and self._virtual_width > 0:
+            self._scrollbar_x.value = self._scroll[0] / self._virtual_width
 
-        return tuple(
-            span for span in zml_get_spans(markup) if span is not FULL_RESET
-        )
+        if self._scrollbar_y is not None and self._virtual_height > 0:
+            self._scrollbar_y.value = self._scroll[1] / self._virtual_height
 
     def _update_scrollbars(self, width: int, height: int) -> None:
         def _get_size(computed: int, virtual: int, framed: int) -> int:
             return int(computed * (framed / (virtual or framed)))
 
+        bar_x, bar_y = self.scrollbar_x, self.scrollbar_y
+
+        key = (
+            width,
+            height,
+            self.position,
+            self.computed_width,
+            self.computed_height,
+            self._virtual_width,
+            self._virtual_height,
+            self._frame,
+            tuple(self._clip_start),
+            tuple(self._clip_end),
+            (bar_x.width, bar_x.height, bar_x.width_offset, bar_x.height_offset),
+            (bar_y.width, bar_y.height, bar_y.width_offset, bar_y.height_offset),
+        )
+
+        # Layout only depends on the above, so only the values need syncing otherwise
+        if key == self._scrollbar_layout:
+            self._sync_scrollbars()
+            return
+
+        self._scrollbar_layout = key
+
         self.scrollbar_x.compute_dimensions(width, 1)
         self.scrollbar_y.compute_dimensions(1, height)
 
-        frame_left = self.frame.left != ""
-        frame_top = self.frame.top != ""
-        frame_right = self.frame.right != ""
-        frame_bottom = self.frame.bottom != ""
+        frame_left, frame_top, frame_right, frame_bottom = self.frame.insets
 
         clip_start = list(self._clip_start)
         clip_end = list(self._clip_end)
@@ -667,8 +1039,8 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         clip_start[0] = max(0, clip_start[0] - frame_left)
         clip_start[1] = max(0, clip_start[1] - frame_top)
 
-        start_x += self.frame.left != ""
-        start_y += self.frame.top != ""
+        start_x += frame_left
+        start_y += frame_top
 
         clip_end[0] = max(0, clip_end[0] - frame_right)
         clip_end[1] = max(0, clip_end[1] - frame_bottom)
@@ -698,71 +1070,95 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
             self.computed_height, self._virtual_height, height
         )
 
-    def _apply_frame(  # pylint: disable=too-many-locals
-        self, lines: list[tuple[Span, ...]], width: int
-    ) -> None:
+        # Scroll is only reassigned when it changes, but virtual size may have
+        self._sync_scrollbars()
+
+    def _get_frame_rows(self, width: int) -> tuple[
+        tuple[Span, ...] | None,
+        tuple[Span, ...],
+        tuple[Span, ...],
+        tuple[Span, ...] | None,
+    ]:
+        """Returns the styled top row, sides and bottom row of our frame at `width`."""
+
+        frame = self._frame
+
+        inner_style = outer_style = self.styles["frame"]
+
+        if frame.outer_horizontal or frame.outer_vertical or frame.outer_corner:
+            if self.parent is not None and hasattr(self.parent, "styles"):
+                outer_style = _bind_style(
+                    self.parent.styles["frame"].fill + " " + inner_style.style,
+                    inner_style.fill,
+                )
+
+        return _compose_frame_rows(
+            frame, width, inner_style, outer_style, self._get_unsetter_style()
+        )
+
+    def _apply_frame(self, lines: list[tuple[Span, ...]], width: int) -> None:
         """Adds frame characters around the given lines."""
 
-        def _style(item, outer: bool = False) -> tuple[Span, ...]:
-            style = deepcopy(self.styles["frame"])
+        top_row, left_spans, right_spans, bottom_row = self._get_frame_rows(width)
 
-            if outer:
-                if self.parent is not None and hasattr(self.parent, "styles"):
-                    style.style = self.parent.styles["frame"].fill + " " + style.style
+        framed: list[tuple[Span, ...]] = []
 
-            return self._parse_markup(style(item))
+        if top_row is not None:
+            framed.append(top_row)
 
-        left_top, right_top, right_bottom, left_bottom = self.frame.corners
-        left, top, right, bottom = self.frame.borders
+        previous: tuple[Span, ...] | None = None
+        row: tuple[Span, ...]
 
-        h_outer = self.frame.outer_horizontal
-        v_outer = self.frame.outer_vertical
-        c_outer = self.frame.outer_corner
+        # Filler lines repeat the same tuple, so they can share their framed row too
+        for line in lines:
+            if line is not previous:
+                row = left_spans + line + right_spans
+                previous = line
 
-        for i, line in enumerate(lines):
-            lines[i] = (
-                *_style(left, outer=v_outer),
-                *line,
-                *_style(right, outer=v_outer),
-            )
+            framed.append(row)
 
-        if left_top + top + right_top != "":
-            lines.insert(
-                0,
-                (
-                    *_style(left_top or (left != "") * top, outer=c_outer),
-                    *_style(top * width, outer=h_outer),
-                    *_style(right_top or (right != "") * top, outer=c_outer),
-                ),
-            )
+        if bottom_row is not None:
+            framed.append(bottom_row)
 
-        if left_bottom + bottom + right_bottom != "":
-            lines.append(
-                (
-                    *_style(left_bottom or (left != "") * bottom, outer=c_outer),
-                    *_style(bottom * width, outer=h_outer),
-                    *_style(right_bottom or (right != "") * bottom, outer=c_outer),
-                )
-            )
+        lines[:] = framed
 
-    def _horizontal_align(self, line: tuple[Span, ...], width: int) -> tuple[Span, ...]:
-        """Aligns a tuple of spans horizontally, using `self.alignment[0]`."""
+    def _horizontal_align(
+        self,
+        line: tuple[Span, ...],
+        width: int,
+        alignment: Alignment | None = None,
+        style: BoundStyle | None = None,
+        length: int | None = None,
+    ) -> tuple[Span, ...]:
+        """Aligns a tuple of spans horizontally.
 
-        alignment = self.alignment[0]
+        Args:
+            line: The line to align.
+            width: The width to align within.
+            alignment: The alignment to use. Defaults to `self.alignment[0]`.
+            style: The style used for padding. Defaults to `self.styles["content"]`.
+            length: The line's length, if already known by the caller.
+        """
 
-        width = max(width, self._virtual_width)
-        length = sum(len(span) for span in line)
-        diff = width - length
+        if alignment is None:
+            alignment = self.alignment[0]
+
+        if style is None:
+            style = self.styles["content"]
 
-        style = self.styles["content"]
+        if length is None:
+            length = sum(map(len, line))
 
-        if line in [tuple(), (Span(""),)]:
+        diff = width - length
+
+        if line in _EMPTY_LINES:
             return self._parse_markup(style(diff * " "))
 
-        if alignment is Alignment.START:
-            return (*line[:-1], line[-1].mutate(text=line[-1].text + diff * " "))
+        if alignment is _ALIGN_START:
+            text = line[-1].text
+            return line[:-1] + (line[-1].mutate(text=text.ljust(len(text) + diff)),)
 
-        if alignment is Alignment.CENTER:
+        if alignment is _ALIGN_CENTER:
             end, extra = divmod(diff, 2)
             start = end + extra
 
@@ -772,136 +1168,103 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                 return self._parse_markup(style((start + end) * " "))
 
             return (
-                *self._parse_markup(style(start * " ")),
-                line[0],
-                *line[1:],
-                *self._parse_markup(style(end * " ")),
+                self._parse_markup(style(start * " "))
+                + line
+                + self._parse_markup(style(end * " "))
             )
 
-        if alignment is Alignment.END:
+        if alignment is _ALIGN_END:
             span = line[0]
+            text = span.text
 
-            return (span.mutate(text=diff * " " + span.text), *line[1:])
+            return (span.mutate(text=text.rjust(len(text) + diff)),) + line[1:]
 
         raise NotImplementedError(f"Unknown alignment {alignment!r}.")
 
-    def _vertical_align(self, lines: list[tuple[Span, ...]], height: int) -> None:
-        """Aligns a list of tuples of spans vertically, using `self.alignment[1]`.
+    def _vertical_padding(self, available: int) -> tuple[int, int]:
+        """Returns how many filler lines go above & below content, by `alignment[1]`.
 
-        Note that this mutates `lines`.
+        Args:
+            available: The number of lines not taken up by content.
         """
 
+        # Content already fills (or overflows) the height, nothing to pad
+        if available <= 0:
+            return 0, 0
+
         alignment = self.alignment[1]
 
-        available = height - len(lines)
-        filler = self._parse_markup(self.styles["content"](" "))
+        if alignment is _ALIGN_START:
+            return 0, available
 
-        if alignment is Alignment.START:
-            lines.extend([filler] * available)
-            return
-
-        if alignment is Alignment.CENTER:
+        if alignment is _ALIGN_CENTER:
             top, extra = divmod(available, 2)
-            bottom = top + extra
-
-            for _ in range(top):
-                lines.insert(0, filler)
-
-            lines.extend([filler] * bottom)
-            return
+            return top, top + extra
 
-        for _ in range(available):
-            lines.insert(0, filler)
+        return available, 0
 
     @lru_cache(1024)
-    def _slice_line(
-        self, line: tuple[Span, ...], start: int, end: int
+    def _slice_line(  # pylint: disable=too-many-arguments
+        self,
+        line: tuple[Span, ...],
+        start: int,
+        end: int,
+        *,
+        alignment: Alignment | None = None,
+        align_width: int = 0,
+        style: BoundStyle | None = None,
     ) -> tuple[Span, ...]:
-        """Slices a line into the given width."""
-
-        if end is None:
-            end = len(line) - 1
-
-        width = end - start
-
-        line_list = []
-        before_start = 0
-        occupied = 0
-
-        # Slice to start
-        for span in line:
-            length = len(span)
+        """Slices a line into the given width.
 
-            before_start += length
-            if before_start < start:
-                continue
-
-            new = span[max(start - (before_start - length), 0) :]
-            length = len(new)
-
-            if length == 0:
-                continue
-
-            line_list.append(new)
-
-            occupied += length
-
-            if occupied > width:
-                break
+        If `alignment` is given the line is first aligned within `align_width` (see
+        `_horizontal_align`), so both steps share the same cache entry.
+        """
 
-        width_diff = max(occupied - width, 0)
-        empty = []
+        occupied = sum(map(len, line))
 
-        # Slice from end
-        if width_diff > 0 and len(line_list) > 0:
-            for i, span in enumerate(reversed(line_list)):
-                new = span[:-width_diff]
-                width_diff -= len(span) - len(new)
+        if alignment is not None:
+            line = self._horizontal_align(
+                line, align_width, alignment, style, length=occupied
+            )
+            occupied = sum(map(len, line))
 
-                if len(new) == 0:
-                    empty.append(-i - 1)
-                else:
-                    line_list[-i - 1] = new
+        if end is None:
+            end = len(line) - 1
 
-                if width_diff <= 0:
-                    break
+        width = end - start
 
-        # Remove 0 length spans
-        for offset, i in enumerate(empty):
-            line_list.pop(i - offset)
+        # Lines that already fit only need padding, not trimming
+        if start == 0 and occupied <= width:
+            line_list = [span for span in line if span.text]
+        else:
+            line_list = _trim_spans(line, start, width)
+            occupied = sum(map(len, line_list))
 
         if not line_list:
             line_list.extend(self._parse_markup(self.styles["content"](" ")))
-
-        occupied = sum(len(span) for span in line_list)
+            occupied = sum(map(len, line_list))
 
         if occupied < width:
             suffix = line_list[-1]
+            text = suffix.text
 
-            line_list[-1] = suffix.mutate(text=suffix.text + (width - occupied) * " ")
+            line_list[-1] = suffix.mutate(text=text.ljust(len(text) + width - occupied))
 
         return tuple(line_list)
 
     def _apply_mouse_state(self, action: MouseAction) -> None:
         """Applies a state change action based on mouse input."""
 
-        value = action.value
+        state_action = _MOUSE_STATE_ACTIONS[action]
 
-        if "click" in value:
-            self.state_machine.apply_action("CLICKED")
+        # Drags & scrolls don't affect state, so don't try any transitions for them
+        if state_action is None:
             return
 
-        if "release" in value:
-            self.state_machine.apply_action("RELEASED")
-
-            if self._selected_index is not None:
-                self.state_machine.apply_action("SELECTED")
-
-            return
+        self.state_machine.apply_action(state_action)
 
-        if "hover" in value:
-            self.state_machine.apply_action("HOVERED")
-            return
+        if state_action == "RELEASED" and self._selected_index is not None:
+            self.state_machine.apply_action("SELECTED")
 
     def _compute_shrink_width(self) -> int:
         """Computes the minimum width this widget's content takes up.
@@ -919,6 +1282,17 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         raise NotImplementedError(f"widget {self!r} does not implement shrink height.")
 
+    def get_shrink_size(self) -> tuple[int | None, int | None]:
+        """Returns our content's size along the dimensions we shrink in.
+
+        Dimensions that don't shrink are returned as `None`.
+        """
+
+        return (
+            self._compute_shrink_width() if self.width == -1 else None,
+            self._compute_shrink_height() if self.height == -1 else None,
+        )
+
     def setup(self) -> None:
         """Use this to do simple setup actions without overriding __init__."""
 
@@ -1009,7 +1383,9 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
     def query_changed(self) -> bool:
         """Returns whether the result of `as_query` has changed since last call."""
 
-        query = self.as_query(state=True)
+        # Compare the parts of the query instead of building the string each frame.
+        # Our type can't change, so it is left out.
+        query = (self.eid, tuple(self.groups), self.state)
         value = query != self._last_query
 
         self._last_query = query
@@ -1061,18 +1437,16 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         overflow = self.overflow[index]
 
-        if overflow is Overflow.SCROLL:
+        if overflow is _OVERFLOW_SCROLL:
             return True
 
-        if overflow is Overflow.HIDE:
+        if overflow is _OVERFLOW_HIDE:
             return False
 
-        real, virt = [
-            (self._framed_width, self._virtual_width),
-            (self._framed_height, self._virtual_height),
-        ][index]
+        if index == 0:
+            return self._virtual_width > self._framed_width
 
-        return virt > real
+        return self._virtual_height > self._framed_height
 
     def drawables(self) -> Iterable[Widget]:
         """Yields all contained widgets that should be drawn."""
@@ -1097,15 +1471,25 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         self._clip_start = start
         self._clip_end = end
 
+    def is_clipped_out(self) -> bool:
+        """Determines whether the clipping rectangle hides the entire widget."""
+
+        return (
+            self._clip_start[0] + self._clip_end[0] >= self.computed_width
+            or self._clip_start[1] + self._clip_end[1] >= self.computed_height
+        )
+
     def add_group(self, target: str) -> None:
         """Adds a group to the widget's groups."""
 
-        self.groups = tuple(list(self.groups) + [target])
+        # tuple() returns tuples as-is, so this only copies if groups was reassigned
+        self.groups = tuple(self.groups) + (target,)
 
     def remove_group(self, target: str) -> None:
         """Removes a group from the widget's groups."""
 
-        self.groups = tuple(group for group in self.groups if group != target)
+        if target in self.groups:
+            self.groups = tuple(group for group in self.groups if group != target)
 
     def toggle_group(self, target: str) -> bool:
         """Toggles a group in the widget's groups."""
@@ -1239,12 +1623,14 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         self._apply_mouse_state(action)
 
+        can_scroll_x, can_scroll_y = self.has_scrollbar(0), self.has_scrollbar(1)
+
         bars = []
 
-        if self.has_scrollbar(0):
+        if can_scroll_x:
             bars.append(self.scrollbar_x)
 
-        if self.has_scrollbar(1):
+        if can_scroll_y:
             bars.append(self.scrollbar_y)
 
         result, mouse_target, hover_target = handle_mouse_on_children(
@@ -1262,18 +1648,17 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         if result:
             return True
 
-        if "scroll" in action.value:
-            can_scroll_x, can_scroll_y = self.has_scrollbar(0), self.has_scrollbar(1)
-
+        if action in _SCROLL_ACTIONS:
             if can_scroll_x:
-                forward = [MouseAction.SCROLL_LEFT, MouseAction.SHIFT_SCROLL_UP]
-                backward = [MouseAction.SCROLL_RIGHT, MouseAction.SHIFT_SCROLL_DOWN]
-
-                if action in forward and self.scroll[0] > 0:
+                if action in _SCROLL_X_FORWARD and self.scroll[0] > 0:
                     self.scroll = (self.scroll[0] - self.scroll_step, self.scroll[1])
                     return True
 
-                if action in backward and self.scroll[0] + self.computed_width - can_scroll_y <= self._virtual_width:
+                if (
+                    action in _SCROLL_X_BACKWARD
+                    and self.scroll[0] + self.computed_width - can_scroll_y
+                    <= self._virtual_width
+                ):
                     self.scroll = (self.scroll[0] + self.scroll_step, self.scroll[1])
                     return True
 
@@ -1286,8 +1671,8 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                     self.scroll = (self.scroll[0], self.scroll[1] + self.scroll_step)
                     return True
 
-        for name in _MOUSE_ACTION_NAME_OPTIONS[action]:
-            if (handle := getattr(self, f"on_{name}", None)) is not None:
+        for name in _MOUSE_HANDLER_NAMES[action]:
+            if (handle := getattr(self, name, None)) is not None:
                 return handle(action, position)
 
         # TODO: Scroll propagation algorithm:
@@ -1326,63 +1711,109 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
 
         raise NotImplementedError
 
-    def build(
-        self, *, virt_width: int | None = None, virt_height: int | None = None
-    ) -> list[tuple[Span, ...]]:
-        """Builds the strings that represent the widget."""
+    def _get_build_key(
+        self, content: list[str], virt_width: int | None, virt_height: int | None
+    ) -> tuple[Any, ...]:
+        """Returns all the inputs `build` composes its lines from.
 
-        self.pre_build(self)
+        If this is equal to the key of the last build, its lines are reused.
+        """
 
-        width = self._framed_width
-        height = self._framed_height
+        frame = self._frame
+        outer_fill = None
 
-        def _clamp_scrolls() -> tuple[int, int]:
-            x_bar = width < self._virtual_width
-            y_bar = height < self._virtual_height
+        if frame.outer_horizontal or frame.outer_vertical or frame.outer_corner:
+            if self.parent is not None and hasattr(self.parent, "styles"):
+                outer_fill = self.parent.styles["frame"].fill
 
-            return (
-                max(min(self.scroll[0], self._virtual_width - width + x_bar), 0),
-                max(min(self.scroll[1], self._virtual_height - height + y_bar), 0),
-            )
+        # Styles are cached per state, so an unchanged state compares by identity
+        return (
+            tuple(content),
+            self.styles,
+            self._get_unsetter_style(),
+            self.computed_width,
+            self.computed_height,
+            self.scroll,
+            tuple(self._clip_start),
+            tuple(self._clip_end),
+            frame,
+            self._alignment,
+            self._overflow,
+            virt_width,
+            virt_height,
+            outer_fill,
+        )
 
-        self.scroll = _clamp_scrolls()
+    def _measure_content(
+        self, content: list[str], virt_width: int | None, virt_height: int | None
+    ) -> list[tuple[Span, ...]]:
+        """Parses content lines into spans, and stores the virtual size they take up.
 
-        self.pre_content(self)
+        Scroll clamping & scrollbars rely on the virtual size, so it is measured even
+        when the lines themselves won't be composed.
+        """
 
-        content_style = self.styles["content"]
-        lines: list[tuple[Span, ...]] = [
-            self._parse_markup(
-                content_style(preserve_escapes(line))
-            ) for line in self.get_content()
-        ]
+        parse = partial(_parse_markup_cached, self._get_unsetter_style())
 
-        self.on_content(self)
+        lines: list[tuple[Span, ...]] = list(
+            map(parse, map(self.styles["content"], map(preserve_escapes, content)))
+        )
 
+        # Measure virtual size in one pass, before any clipping or padding happens
         self._virtual_height = virt_height or len(lines) or 1
         self._virtual_width = virt_width or max(
-            (sum(len(span) for span in line) for line in lines), default=1
+            (sum(map(len, line)) for line in lines), default=1
         )
 
-        # Clip into vertical size
-        if self._virtual_height > height:
-            lines = lines[self.scroll[1] : self.scroll[1] + height]
+        return lines
 
-            if len(lines) < height:
-                lines.extend([(EMPTY_SPAN,)] * (height - len(lines)))
+    def _build_lines(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        content: list[str],
+        width: int,
+        height: int,
+        virt_width: int | None,
+        virt_height: int | None,
+    ) -> list[tuple[Span, ...]]:
+        """Composes content lines into the final, framed & clipped lines."""
 
-        # Handle alignment
-        self._vertical_align(lines, height)
+        # Bind everything used inside the per-line loops up front
+        slice_line = self._slice_line
+        scroll_x, scroll_y = self.scroll
+        clip_start_x, clip_start_y = self._clip_start
+        clip_end_x, clip_end_y = self._clip_end
+
+        # Resolve styles once, instead of once per line through `_parse_markup`
+        content_style = self.styles["content"]
+        parse = partial(_parse_markup_cached, self._get_unsetter_style())
 
-        for i, line in enumerate(lines):
-            lines[i] = self._horizontal_align(line, width)
+        lines = self._measure_content(content, virt_width, virt_height)
+        virt_width, virt_height = self._virtual_width, self._virtual_height
 
-        # Clip into horizontal size
+        # Clip into vertical size, scrolled content is padded below, the rest aligned
+        if virt_height > height:
+            lines = lines[scroll_y : scroll_y + height]
+            top, bottom = 0, max(height - len(lines), 0)
+        else:
+            top, bottom = self._vertical_padding(height - len(lines))
+
+        filler = parse(content_style(" "))
+        alignment = self.alignment[0]
+        align_width = max(width, virt_width)
+
+        # Pad, align & clip into horizontal size in a single pass
         lines = [
-            self._slice_line(line,
-                self.scroll[0],
-                self.scroll[0] + width
+            _coalesce_spans(
+                slice_line(
+                    line,
+                    scroll_x,
+                    scroll_x + width,
+                    alignment=alignment,
+                    align_width=align_width,
+                    style=content_style,
+                )
             )
-            for line in lines
+            for line in chain(repeat(filler, top), lines, repeat(filler, bottom))
         ]
 
         self._apply_frame(lines, width)
@@ -1395,31 +1826,83 @@ class Widget:  # pylint: disable=too-many-instance-attributes,too-many-public-me
         #         slice scroll + clip (offset by frame?)
         #         remove frame if clipped?
 
-        lines = [
-            self._slice_line(line,
-                self._clip_start[0],
-                self.computed_width - self._clip_end[0]
-            )
-            for line in lines
-        ]
+        clip_end = self.computed_width - clip_end_x
 
-        lines = lines[self._clip_start[1] :]
+        lines = [slice_line(line, clip_start_x, clip_end) for line in lines]
+        lines = lines[clip_start_y:]
 
-        if self._clip_end[1] > 0:
-            lines = lines[: -self._clip_end[1]]
+        if clip_end_y > 0:
+            lines = lines[:-clip_end_y]
 
-        both = self.has_scrollbar(0) and self.has_scrollbar(1)
-        self._update_scrollbars(width - both, height - both)
+        return lines
+
+    def _clamp_scroll(self, width: int, height: int) -> None:
+        """Clamps our scroll so the given framed size stays within virtual size."""
+
+        scroll_x, scroll_y = scroll = self._scroll
+        virt_x, virt_y = self._virtual_width, self._virtual_height
+
+        clamped = (
+            max(min(scroll_x, virt_x - width + (width < virt_x)), 0),
+            max(min(scroll_y, virt_y - height + (height < virt_y)), 0),
+        )
+
+        # Most widgets never scroll, so don't go through the setter for no change
+        if clamped != scroll:
+            self.scroll = clamped
+
+    def build(
+        self, *, virt_width: int | None = None, virt_height: int | None = None
+    ) -> list[tuple[Span, ...]]:
+        """Builds the strings that represent the widget."""
+
+        self.pre_build(self)
+
+        width = self._framed_width
+        height = self._framed_height
+
+        self._clamp_scroll(width, height)
+
+        self.pre_content(self)
+
+        content = self.get_content()
+
+        self.on_content(self)
+
+        # A widget without any area is always clipped out
+        clipped_out = self.is_clipped_out()
+
+        # Lines that are clipped away entirely are never shown, so don't compose them.
+        # They are still measured, so scroll isn't clamped against a stale size.
+        if clipped_out:
+            self._measure_content(content, virt_width, virt_height)
+
+        else:
+            key = self._get_build_key(content, virt_width, virt_height)
+
+            if key != self._build_cache[0]:
+                self._build_cache = (
+                    key,
+                    self._build_lines(
+                        content, width, height, virt_width, virt_height
+                    ),
+                )
+
+        x_bar = self.has_scrollbar(0)
+        y_bar = self.has_scrollbar(1)
+
+        # Scrollbars are only drawn (and handle mouse) when shown, so there is no need
+        # to lay them out otherwise.
+        if x_bar or y_bar:
+            both = x_bar and y_bar
+            self._update_scrollbars(width - both, height - both)
 
         self.on_build(self)
 
-        if (
-            self._clip_start[0] + self._clip_end[0] >= self.computed_width
-            or self._clip_start[1] + self._clip_end[1] >= self.computed_height
-        ):
+        if clipped_out:
             return []
 
-        return lines
+        return self._build_cache[1]
 
 
 widget_annotations = Widget.__annotations__
@@ -138,6 +138,20 @@ def test_state_machine_copy():
     assert state._transitions == og._transitions
 
 
+def test_state_machine_clone():
+    og = get_state_machine()
+    og.apply_action("SUBSTATE_ENTER_BLUR")
+
+    state = og.clone()
+    assert state() == "idle/blur"
+    assert state._transitions is og._transitions
+    assert state.on_change is not og.on_change
+
+    state.apply_action("HOVERED")
+    assert state() == "hover/blur"
+    assert og() == "idle/blur"
+
+
 def test_state_machine_substates():
     state = get_state_machine()
 
@@ -1,89 +1,127 @@
 from __future__ import annotations
 
-from io import StringIO
-from contextlib import contextmanager
+from contextlib import nullcontext
+
+import pytest
 
 from celadon import Application, Page, Tower, Row, Text, Widget
+from celadon.widgets.widget import _coalesce_spans
 
 from slate import Span, Terminal, Color
 from zenith import zml_get_spans
 
+DIGITS = "0123456789"
+
+# The top & bottom rows of every ascii_x framed, 20 wide widget in these tests
+FRAME_EDGE = ("X", "-" * 18, "X")
+
+SLICE_SPANS = zml_get_spans("[blue]tes[@red]t[/ blue] content")
+
+ALIGNMENT_RULES = """
+Text:
+    width: 20
+    height: 5
+
+    frame: ascii_x
+"""
+
+SCROLLING_RULES = """
+Text:
+    width: 20
+    height: 10
+    overflow: [scroll, scroll]
+
+    frame: ascii_x
+"""
+
+
+# Tests never read the terminal's output, so it is discarded instead of collected
+class _NullStream:
+    def write(self, data: str) -> int:
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+
+_NO_ECHO = nullcontext()
+
 
 class SizedTerminal(Terminal):
-    stream = StringIO()
+    stream = _NullStream()
 
     @property
     def size(self) -> tuple[int, int]:
         return 80, 24
 
-    @contextmanager
-    def no_echo(self):
-        try:
-            yield
-        finally:
-            pass
+    def no_echo(self) -> nullcontext:
+        return _NO_ECHO
 
 
 def _format_lines(lines: list[tuple[Span]]) -> str:
     return "\n" + ",\n".join(
-        "(" + ", ".join(map(repr, map(str, line))) + ")" for line in lines
+        f"({', '.join(repr(str(span)) for span in line)})" for line in lines
     )
 
 
-def _as_spans(text: list[tuple[str]]) -> list[tuple[Span]]:
-    def _to_span(item: str | Span) -> Span:
-        if isinstance(item, Span):
-            return item
+def _as_spans(text: list[tuple[str | Span, ...]]) -> list[tuple[Span, ...]]:
+    return [
+        tuple(item if type(item) is Span else Span(item) for item in line if item)
+        for line in text
+    ]
+
+
+@pytest.fixture(name="app", scope="module")
+def fixture_app() -> Application:
+    app = Application("Test Runner", terminal=SizedTerminal())
+    app.rule(
+        "*",
+        content_style="",
+        frame_style="",
+        fill_style="",
+        scrollbar_x_style="",
+        scrollbar_y_style="",
+    )
+
+    return app
 
-        return Span(item)
 
-    output = []
-    length = len(text)
+def apply_rules(app: Application, widget: Widget, rules: str | None = None) -> Widget:
+    page = Page(Tower(widget), rules=(rules or ""))
 
-    for i, line in enumerate(text):
-        output.append(tuple(map(_to_span, filter(lambda item: item != "", line))))
+    app += page
+    app.route(page.route_name)
 
-    return output
+    # Do what the first frame of the draw loop would, without running the app
+    app.apply_rules()
 
+    for child in page:
+        child.compute_dimensions(*app.terminal.size)
 
-def apply_rules(widget: Widget, rules: str | None = None) -> Widget:
-    with Application("Test Runner", terminal=SizedTerminal()) as app:
-        app.rule(
-            "*",
-            content_style="",
-            frame_style="",
-            fill_style="",
-            scrollbar_x_style="",
-            scrollbar_y_style="",
-        )
+        for drawable in child.drawables():
+            drawable.build()
 
-        app += Page(Tower(widget), rules=(rules or ""))
-        app.timeout(0, lambda: app.stop())
+    app.remove_page(page)
 
     return widget
 
 
-def test_widget_alignment() -> None:
+def test_widget_alignment(app: Application) -> None:
     w = apply_rules(
+        app,
         Text("hello"),
-        """
-    Text:
-        width: 20
-        height: 5
-
-        frame: ascii_x
-    """,
+        ALIGNMENT_RULES,
     )
 
     w.alignment = ["start", "start"]
 
     assert (output := w.build()) == _as_spans(
         [
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
             ("|", "hello             ", "|"),
             ("|", "                  ", "|"),
             ("|", "                  ", "|"),
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
         ]
     ), _format_lines(output)
 
@@ -91,11 +129,11 @@ def test_widget_alignment() -> None:
 
     assert (output := w.build()) == _as_spans(
         [
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
             ("|", "                  ", "|"),
-            ("|", "       ", "hello", "      ", "|"),
+            ("|", "       hello      ", "|"),
             ("|", "                  ", "|"),
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
         ]
     ), _format_lines(output)
 
@@ -103,33 +141,27 @@ def test_widget_alignment() -> None:
 
     assert (output := w.build()) == _as_spans(
         [
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
             ("|", "                  ", "|"),
             ("|", "                  ", "|"),
             ("|", "hello             ", "|"),
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
         ]
     ), _format_lines(output)
 
 
-def test_widget_scrolling() -> None:
+def test_widget_scrolling(app: Application) -> None:
     w = apply_rules(
+        app,
         Text(
             "\n".join("".join(map(lambda i: str(i % 10), range(20))) for _ in range(20))
         ),
-        """
-        Text:
-            width: 20
-            height: 10
-            overflow: [scroll, scroll]
-
-            frame: ascii_x
-        """,
+        SCROLLING_RULES,
     )
 
     assert (output := w.build()) == _as_spans(
         [
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
             ("|", "01234567890123456", "#", "|"),
             ("|", "01234567890123456", "#", "|"),
             ("|", "01234567890123456", "#", "|"),
@@ -138,7 +170,7 @@ def test_widget_scrolling() -> None:
             ("|", "01234567890123456", "|", "|"),
             ("|", "01234567890123456", "|", "|"),
             ("|", "################- ", "|"),
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
         ]
     ), _format_lines(output)
 
@@ -146,7 +178,7 @@ def test_widget_scrolling() -> None:
 
     assert (output := w.build()) == _as_spans(
         [
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
             ("|", "01234567890123456", "|", "|"),
             ("|", "01234567890123456", "|", "|"),
             ("|", "01234567890123456", "|", "|"),
@@ -155,7 +187,7 @@ def test_widget_scrolling() -> None:
             ("|", "01234567890123456", "#", "|"),
             ("|", "01234567890123456", "#", "|"),
             ("|", "################- ", "|"),
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
         ]
     ), _format_lines(output)
 
@@ -163,7 +195,7 @@ def test_widget_scrolling() -> None:
 
     assert (output := w.build()) == _as_spans(
         [
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
             ("|", "34567890123456789", "|", "|"),
             ("|", "34567890123456789", "|", "|"),
             ("|", "34567890123456789", "#", "|"),
@@ -172,7 +204,7 @@ def test_widget_scrolling() -> None:
             ("|", "34567890123456789", "|", "|"),
             ("|", "34567890123456789", "|", "|"),
             ("|", "-################ ", "|"),
-            ("X", "------------------", "X"),
+            FRAME_EDGE,
         ]
     ), _format_lines(output)
 
@@ -180,11 +212,81 @@ def test_widget_scrolling() -> None:
 def test_widget_slice_line() -> None:
     w = Widget()
 
-    spans = zml_get_spans("[blue]tes[@red]t[/ blue] content")
-    sliced = w._slice_line(spans, 0, 3)
+    sliced = w._slice_line(SLICE_SPANS, 0, 3)
     assert sliced == (Span("tes", reset_after=True, foreground=Color(rgb=(0, 0, 255))),)
 
 
+def test_widget_coalesce_spans() -> None:
+    red = Color(rgb=(255, 0, 0))
+
+    line = (
+        Span("ab"),
+        Span("cd"),
+        Span("ef", foreground=red),
+        Span("g", foreground=red),
+    )
+    assert _coalesce_spans(line) == (Span("abcd"), Span("efg", foreground=red))
+
+    line = (Span("ab"), Span("cd", bold=True), Span("ef"))
+    assert _coalesce_spans(line) is line
+
+
+def test_widget_build_cache() -> None:
+    w = Text("hello")
+    w.computed_width = 10
+    w.computed_height = 3
+
+    lines = w.build()
+    assert w.build() is lines
+
+    w.content = "world"
+    assert w.build() is not lines
+
+    lines = w.build()
+    w.disabled = True
+    assert w.build() is not lines
+
+    lines = w.build()
+    w.computed_width = 12
+    assert w.build() is not lines
+
+
+def test_widget_shared_spans() -> None:
+    first, second = Text("hello"), Text("world")
+
+    for widget in (first, second):
+        widget.frame = "ascii_x"
+        widget.computed_width = 10
+        widget.computed_height = 3
+
+    # Frame & filler spans are parsed once, and reused by every widget drawing them
+    for first_span, second_span in zip(first.build()[0], second.build()[0]):
+        assert first_span is second_span
+
+
+def test_widget_shared_filler_rows() -> None:
+    w = Text("hello")
+    w.frame = "ascii_x"
+    w.computed_width = 10
+    w.computed_height = 6
+
+    _, _, *fillers, _ = w.build()
+    assert all(row is fillers[0] for row in fillers)
+
+
+def test_widget_zero_size() -> None:
+    w = Text("hello")
+    w.computed_width = 0
+    w.computed_height = 3
+
+    assert w.build() == []
+
+    w.computed_width = 5
+    w.computed_height = 0
+
+    assert w.build() == []
+
+
 def test_widget_selection() -> None:
     w = Widget()
     assert w._selected_index is None
@@ -219,3 +321,88 @@ def test_widget_selection() -> None:
     w.select(2)
     assert w.selected is outer_target
     assert w.state == "selected"
+
+
+def test_container_fill_remainder(app: Application) -> None:
+    children = [Text("a"), Text("b"), Text("c")]
+    w = apply_rules(
+        app,
+        Tower(*children),
+        "Tower:\n    width: 10\n    height: 10\n\nText:\n    height: null\n",
+    )
+
+    w.get_content()
+    assert [child.computed_height for child in children] == [4, 3, 3]
+
+
+def test_container_layout_cache(
+    app: Application, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    child = Text("a")
+    w = apply_rules(app, Tower(child, Text("b")), "Tower:\n    width: 10\n")
+
+    calls = []
+    arrange = Tower.arrange
+
+    def _arrange(self: Tower, x: int, y: int) -> None:
+        calls.append(self)
+        arrange(self, x, y)
+
+    monkeypatch.setattr(Tower, "arrange", _arrange)
+
+    w.get_content()
+    assert calls == []
+
+    child.content = "longer"
+    w.get_content()
+    assert calls == [w]
+
+    child.frame = "ascii_x"
+    w.get_content()
+    assert calls == [w, w]
+
+    child.width = 5
+    w.get_content()
+    w.get_content()
+    assert calls == [w, w, w]
+
+
+def test_container_clipped_out(app: Application) -> None:
+    child = Text("hello")
+    w = apply_rules(app, Tower(child), "Tower:\n    width: 10\n    height: 4\n")
+
+    w.clip([0, 4], [0, 0])
+    assert w.build() == []
+    assert child.is_clipped_out()
+    assert child.build() == []
+
+
+def test_widget_clipped_out_scrollbars() -> None:
+    w = Text("  lead\n\ntrail  ")
+    w.frame = "ascii_x"
+    w.overflow = ("hide", "scroll")
+    w.computed_width = 10
+    w.computed_height = 2
+
+    # Clipped out on the first build, before any content was measured
+    w.clip((1, 1), (0, 2))
+    assert w.build() == []
+
+
+def test_widget_clipped_out_scroll() -> None:
+    w = Text("\n".join(DIGITS for _ in range(10)))
+    w.overflow = ("scroll", "scroll")
+    w.computed_width = 6
+    w.computed_height = 4
+
+    # Only ever built while off-screen, then scrolled
+    w.clip((0, 4), (0, 0))
+    assert w.build() == []
+
+    w.scroll = (4, 3)
+    assert w.build() == []
+    assert w.scroll == (4, 3)
+
+    w.clip((0, 0), (0, 0))
+    assert w.build()[0][0].text.startswith("45678")
+    assert w.scroll == (4, 3)